@@ -1,33 +1,376 @@
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from binance import Client
 from binance.exceptions import BinanceAPIException
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
 import argparse
 from datetime import datetime
 import time
 import sys
+import uuid
+import threading
+import asyncio
+import atexit
+import hashlib
+import hmac
+import json
+import queue
+from decimal import Decimal, InvalidOperation
+from urllib.parse import urlencode
 
-class BasicBot:
-    def __init__(self, api_key, api_secret, testnet=True):
+import aiohttp
+import websockets
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib decoder
+    orjson = None
+
+json_loads = orjson.loads if orjson else json.loads
+
+# Binance error code for an order id it has no record of
+ORDER_NOT_FOUND = -2013
+
+
+def configure_logging():
+    """
+    Configure the shared file + console logging used by both bot variants.
+    The root logger only enqueues records; a background QueueListener does the
+    file and console I/O so order paths never wait on it.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return  # Already configured
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler('trading_bot.log'),
+        logging.StreamHandler()
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def backoff_delay(attempt):
+    """
+    Exponential backoff delay before a retry
+    :param attempt: Zero-based attempt number that just failed
+    :return: Delay in seconds (50ms doubling up to 1s)
+    """
+    return min(0.05 * (2 ** attempt), 1.0)
+
+
+def request_not_sent(error):
+    """
+    Tell whether a requests connection error happened before the request was sent
+    :param error: requests.exceptions.ConnectionError or Timeout
+    :return: True if the server cannot have received the request
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def retry_after(error):
+    """
+    Seconds Binance asked the client to wait, from the Retry-After header of an error response
+    :param error: BinanceAPIException
+    :return: Seconds to wait, or None if the header is missing or not a number
+    """
+    headers = getattr(error.response, 'headers', None) or {}
+    try:
+        return float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+def hmac_signer(secret):
+    """
+    Build an HMAC-SHA256 signer whose keyed state is set up once and copied per request
+    :param secret: API secret
+    :return: Function mapping a query string to its hex signature
+    """
+    template = hmac.new(secret.encode('utf-8'), b'', hashlib.sha256)
+
+    def sign(query_string):
+        h = template.copy()
+        h.update(query_string.encode('utf-8'))
+        return h.hexdigest()
+
+    return sign
+
+
+def orjson_response_hook(response, *args, **kwargs):
+    """requests response hook that decodes JSON bodies with orjson"""
+    response.json = lambda **kw: orjson.loads(response.content)
+    return response
+
+
+class AsyncBinanceAPIException(BinanceAPIException):
+    """
+    BinanceAPIException raised by AsyncBasicBot.
+    Built from the already-read body text, since aiohttp's response.text is a coroutine.
+    """
+
+    def __init__(self, response, status_code, text):
+        self.code = 0
+        self.message = f"Invalid JSON error message from Binance: {text}"
+        try:
+            json_res = json_loads(text)
+        except ValueError:
+            pass
+        else:
+            if isinstance(json_res, dict):
+                self.code = json_res.get('code', 0)
+                self.message = json_res.get('msg', text)
+        self.status_code = status_code
+        self.response = response
+        self.request = None
+        self.text = text
+
+
+def index_symbols(info):
+    """
+    Index exchange info by symbol for O(1) validation lookups.
+    LOT_SIZE and PRICE_FILTER bounds are parsed into Decimals once here.
+    :param info: Futures exchange info response
+    :return: Dict of symbol -> {'status', 'filters', 'lot_size', 'price_filter'}
+    """
+    symbol_map = {}
+    for s in info['symbols']:
+        filters = {f['filterType']: f for f in s['filters']}
+        lot_size = filters.get('LOT_SIZE')
+        price_filter = filters.get('PRICE_FILTER')
+        symbol_map[s['symbol']] = {
+            'status': s['status'],
+            'filters': filters,
+            'lot_size': (
+                Decimal(lot_size['minQty']), Decimal(lot_size['maxQty']), Decimal(lot_size['stepSize'])
+            ) if lot_size else None,
+            'price_filter': (
+                Decimal(price_filter['minPrice']), Decimal(price_filter['maxPrice']), Decimal(price_filter['tickSize'])
+            ) if price_filter else None
+        }
+    return symbol_map
+
+
+def check_step_filter(value, bounds):
+    """
+    Check a value against (min, max, step) filter bounds using exact decimal arithmetic.
+    As in Binance's filters, a bound of 0 disables that part of the check.
+    :param value: Quantity or price to check
+    :param bounds: Tuple of Decimal (min, max, step)
+    :return: Boolean indicating validity (False for non-numeric, NaN or infinite values)
+    """
+    minimum, maximum, step = bounds
+    try:
+        value = Decimal(str(value))
+        if not value.is_finite():
+            return False
+        if minimum and value < minimum:
+            return False
+        if maximum and value > maximum:
+            return False
+
+        # Check if value is a whole number of steps above the minimum
+        return not step or (value - minimum) % step == 0
+    except (InvalidOperation, ValueError):
+        return False  # Not a number
+
+
+class BaseBot:
+    """
+    State and checks shared by BasicBot and AsyncBasicBot.
+    Subclasses do the I/O: fetching exchange info and sending orders.
+    """
+    # Exchange info changes rarely, so it is cached for EXCHANGE_INFO_TTL seconds
+    EXCHANGE_INFO_TTL = 300
+    _exchange_info_cache = None
+    _exchange_info_ts = 0.0
+    _symbol_map = {}
+
+    # Order spec 'type' -> method used by place_order_spec
+    ORDER_METHODS = {
+        'MARKET': 'place_market_order',
+        'LIMIT': 'place_limit_order',
+        'STOP': 'place_stop_limit_order',
+        'CLOSE': 'close_position'
+    }
+
+    # Order type -> label used in log messages
+    ORDER_LABELS = {
+        'MARKET': 'Market',
+        'LIMIT': 'Limit',
+        'STOP': 'Stop-limit'
+    }
+
+    # Waits between order lookups after an unknown outcome (5xx or read timeout). An order
+    # Binance is still processing may not be found yet, so it is only treated as absent
+    # once every lookup in this ~5s window has come back empty.
+    ORDER_SETTLE_DELAYS = (0.5, 1, 1.5, 2)
+    # Longest Retry-After honoured on a 429; longer waits fail the order instead
+    MAX_RETRY_AFTER = 5
+
+    def _place_steps(self, params, retries):
+        """
+        Retry logic shared by the sync and async _place. Yields the I/O steps to run as
+        (method name, *args) tuples: '_send_order', '_find_order', '_sleep' or 'sync_time'.
+        The driver sends back each step's result, or throws its exception in.
+        :param params: Order parameters (symbol, side, type, quantity, ...)
+        :param retries: Number of attempts
+        :return: Order response or None if failed
+        """
+        label = self.ORDER_LABELS[params['type']]
+        # Same id on every attempt so an order with an unknown outcome can be looked up.
+        # Binance only rejects duplicate ids among open orders, so it does not stop a
+        # resend from filling twice; only resend once the lookups find no such order.
+        client_order_id = params.setdefault('newClientOrderId', uuid.uuid4().hex)
+        for attempt in range(retries):
+            last_attempt = attempt == retries - 1
+            try:
+                self.logger.info("%s order (attempt %s): %s", label, attempt + 1, params)
+                order = yield ('_send_order', params)
+                self.logger.info("%s order placed: %s", label, order)
+                return order
+            except BinanceAPIException as e:
+                if e.status_code < 500:
+                    # Rejected without being processed
+                    delay = None if last_attempt else self._rejected_retry_delay(e, attempt)
+                    if delay is None:
+                        self.logger.error("%s order failed: %s", label, e)
+                        return None
+                    if e.code == -1021:  # Timestamp error
+                        yield ('sync_time',)  # Resync only when the server rejects our timestamp
+                    yield ('_sleep', delay)
+                    continue
+                error = e  # 5xx: the order may still have been accepted
+            except self.NETWORK_ERRORS as e:
+                if self._request_not_sent(e):
+                    if last_attempt:
+                        self.logger.error("%s order failed: %s", label, e)
+                        return None
+                    yield ('_sleep', backoff_delay(attempt))
+                    continue
+                error = e  # Read timeout or dropped connection: the order may have reached Binance
+
+            # Outcome unknown: only resend once Binance has had time to show the order
+            for delay in self.ORDER_SETTLE_DELAYS:
+                yield ('_sleep', delay)
+                try:
+                    order = yield ('_find_order', params['symbol'], client_order_id)
+                except (BinanceAPIException,) + self.NETWORK_ERRORS as e:
+                    self.logger.error("%s order %s status unknown, not resending: %s (lookup failed: %s)",
+                                      label, client_order_id, error, e)
+                    return None
+                if order:
+                    self.logger.info("%s order placed: %s", label, order)
+                    return order
+            if last_attempt:
+                self.logger.error("%s order failed: %s", label, error)
+                return None
+            self.logger.warning("%s order %s not found after %ss, resending: %s",
+                                label, client_order_id, sum(self.ORDER_SETTLE_DELAYS), error)
+
+    def _rejected_retry_delay(self, error, attempt):
+        """
+        Delay before resending an order Binance rejected with a 4xx response
+        :param error: BinanceAPIException with a 4xx status
+        :param attempt: Zero-based attempt number that just failed
+        :return: Seconds to wait, or None if the order must not be resent
+        """
+        if error.code == -1021:  # Timestamp error
+            return backoff_delay(attempt)
+        if error.status_code == 429:  # Rate limited: wait as long as Binance asks, if it asks for little
+            delay = retry_after(error)
+            if delay is not None and delay <= self.MAX_RETRY_AFTER:
+                return delay
+        return None  # 418 (IP banned) and any other 4xx are final
+
+    def _store_exchange_info(self, info):
+        """
+        Cache a fresh exchange info response and rebuild the symbol index from it
+        :param info: Futures exchange info response
+        :return: The same exchange info response
+        """
+        self._exchange_info_cache = info
+        self._exchange_info_ts = time.time()
+        self._symbol_map = index_symbols(info)
+        return info
+
+    def _exchange_info_fresh(self):
+        """Tell whether the cached exchange info is younger than EXCHANGE_INFO_TTL"""
+        return time.time() - self._exchange_info_ts < self.EXCHANGE_INFO_TTL
+
+    def _symbol_tradable(self, symbol):
+        """Check the symbol index for a tradable symbol"""
+        return self._symbol_map.get(symbol, {}).get('status') == 'TRADING'
+
+    def _quantity_valid(self, symbol, quantity):
+        """Check a quantity against the symbol's indexed LOT_SIZE filter"""
+        lot_size = self._symbol_map.get(symbol, {}).get('lot_size')
+        return lot_size is not None and check_step_filter(quantity, lot_size)
+
+    def _prices_valid(self, symbol, prices):
+        """Check prices against the symbol's indexed PRICE_FILTER"""
+        price_filter = self._symbol_map.get(symbol, {}).get('price_filter')
+        return price_filter is not None and all(check_step_filter(price, price_filter) for price in prices)
+
+    def _order_spec_call(self, spec):
+        """
+        Resolve an order spec to the place_* method that handles it
+        :param spec: Dict with 'type' plus the keyword arguments of the matching ORDER_METHODS method
+        :return: Tuple of (bound method, keyword arguments)
+        """
+        params = dict(spec)
+        order_type = params.pop('type')
+        if order_type not in self.ORDER_METHODS:
+            raise ValueError(f"Invalid order type: {order_type}")
+        return getattr(self, self.ORDER_METHODS[order_type]), params
+
+
+class BasicBot(BaseBot):
+    FUTURES_STREAM_URL = 'wss://fstream.binance.com/ws/'
+    FUTURES_STREAM_TESTNET_URL = 'wss://stream.binancefuture.com/ws/'
+    # Binance expires listen keys after 60 minutes without a keepalive
+    LISTEN_KEY_KEEPALIVE = 30 * 60
+    USER_STREAM_START_TIMEOUT = 10
+
+    # Network errors _place_steps handles; anything else propagates out of _place
+    NETWORK_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    _sleep = staticmethod(time.sleep)
+
+    def __init__(self, api_key, api_secret, testnet=True, user_stream=False):
         """
         Initialize the trading bot with API credentials
         :param api_key: Binance API key
         :param api_secret: Binance API secret
         :param testnet: Boolean indicating whether to use testnet (default True)
+        :param user_stream: Track positions over the userData websocket (default False)
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
-        self.time_offset = 0
+        self._offset_ms = 0
+        self._positions = {}
+        self._stream_thread = None
+        self._stream_live = threading.Event()
+        self._stream_stop = threading.Event()
+        self._index_refresh_stop = threading.Event()
         
         # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('trading_bot.log'),
-                logging.StreamHandler()
-            ]
-        )
+        configure_logging()
         self.logger = logging.getLogger('BinanceTradingBot')
         
         try:
@@ -40,22 +383,167 @@ class BasicBot:
                     
                 }
             )
+            # Larger keep-alive pool so concurrent callers reuse TLS connections
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=64, max_retries=Retry(total=0))
+            self.client.session.mount('https://', adapter)
+            self.client.session.headers['Connection'] = 'keep-alive'
+            if orjson:
+                self.client.session.hooks['response'].append(orjson_response_hook)
+            # Reuse one keyed HMAC state instead of re-keying on every signed request
+            self.client._hmac_signature = hmac_signer(api_secret)
             self.sync_time()  # Initial time synchronization
             self.logger.info("Successfully connected to Binance API")
         except Exception as e:
-            self.logger.error(f"Failed to initialize client: {e}")
+            self.logger.error("Failed to initialize client: %s", e)
             raise
 
+        # Index symbols once up front so validation never waits on the network
+        try:
+            self._rebuild_symbol_index()
+        except Exception as e:
+            self.logger.warning("Initial symbol index failed, will retry on demand: %s", e)
+        threading.Thread(target=self._refresh_symbol_index_loop, daemon=True).start()
+
+        if user_stream:
+            self.start_user_stream()
+
+    def start_user_stream(self, timeout=USER_STREAM_START_TIMEOUT):
+        """
+        Start the futures userData websocket that keeps positions in memory.
+        The stream runs in its own daemon thread. If it is not connected within
+        `timeout` seconds, positions keep coming from REST while it retries.
+        :param timeout: Seconds to wait for the first connection
+        """
+        if self._stream_thread and self._stream_thread.is_alive():
+            return
+        self._stream_stop.clear()
+        self._stream_thread = threading.Thread(target=lambda: asyncio.run(self._user_stream_loop()), daemon=True)
+        self._stream_thread.start()
+        if self._stream_live.wait(timeout):
+            self.logger.info("User data stream started")
+        else:
+            self.logger.warning("User data stream not connected after %ss, using REST for positions", timeout)
+
+    def stop_user_stream(self):
+        """Stop the userData websocket and fall back to REST position lookups"""
+        self._stream_stop.set()
+        self._stream_live.clear()
+        if self._stream_thread:
+            self._stream_thread.join(timeout=5)
+            self._stream_thread = None
+
+    def close(self):
+        """Stop background symbol index refreshes and the userData websocket"""
+        self._index_refresh_stop.set()
+        self.stop_user_stream()
+
+    async def _user_stream_loop(self):
+        """
+        User stream thread: connect, snapshot, apply events, and reconnect with a
+        fresh snapshot whenever the connection drops
+        """
+        url = self.FUTURES_STREAM_TESTNET_URL if self.testnet else self.FUTURES_STREAM_URL
+        failures = 0
+        while not self._stream_stop.is_set():
+            try:
+                listen_key = await asyncio.to_thread(self.client.futures_stream_get_listen_key)
+                async with websockets.connect(url + listen_key) as ws:
+                    failures = 0
+                    await self._run_user_stream(ws, listen_key)
+            except Exception as e:
+                self.logger.warning("User data stream disconnected: %s", e)
+                failures += 1
+            finally:
+                self._stream_live.clear()
+            await asyncio.to_thread(self._stream_stop.wait, min(2 ** failures, 30))
+
+    async def _run_user_stream(self, ws, listen_key):
+        """
+        Serve one websocket connection until it closes or the stream is stopped
+        :param ws: Connected websocket
+        :param listen_key: Listen key the websocket is subscribed with
+        """
+        # Snapshot only once the socket is up, so every later change arrives as an event
+        snapshot = await asyncio.to_thread(self.client.futures_position_information)
+        self._positions = {p['symbol']: p for p in snapshot}
+        self._stream_live.set()
+
+        next_keepalive = time.monotonic() + self.LISTEN_KEY_KEEPALIVE
+        while not self._stream_stop.is_set():
+            if time.monotonic() >= next_keepalive:
+                await asyncio.to_thread(self.client.futures_stream_keepalive, listen_key)
+                next_keepalive = time.monotonic() + self.LISTEN_KEY_KEEPALIVE
+            try:
+                frame = await asyncio.wait_for(ws.recv(), timeout=1)
+            except asyncio.TimeoutError:
+                continue
+            msg = json_loads(frame)
+            if msg.get('e') == 'listenKeyExpired':
+                raise RuntimeError("listen key expired")
+            self._handle_user_event(msg)
+
+    def _handle_user_event(self, msg):
+        """
+        Apply a userData stream message to the in-memory positions.
+        Updates older than the position already held (e.g. buffered while the
+        snapshot was taken) are ignored.
+        :param msg: Decoded websocket message
+        """
+        if msg.get('e') != 'ACCOUNT_UPDATE':
+            return
+
+        event_time = msg.get('T') or msg.get('E', 0)
+        for p in msg['a']['P']:
+            symbol = p['s']
+            current = self._positions.get(symbol, {})
+            if int(current.get('updateTime', 0)) > event_time:
+                continue
+            position = dict(current)
+            position.update({
+                'symbol': symbol,
+                'positionAmt': p['pa'],
+                'entryPrice': p['ep'],
+                'unRealizedProfit': p['up'],
+                'updateTime': event_time
+            })
+            self._positions[symbol] = position
+
     def sync_time(self):
         """Synchronize local time with Binance server"""
         try:
             server_time = self.client.get_server_time()['serverTime']
-            local_time = int(time.time() * 1000)
-            self.time_offset = server_time - local_time
-            self.logger.info(f"Time synchronized. Offset: {self.time_offset}ms")
+            self._offset_ms = server_time - time.time_ns() // 1_000_000
+            self.logger.info("Time synchronized. Offset: %sms", self._offset_ms)
         except Exception as e:
-            self.logger.warning(f"Time sync failed: {e}")
-            self.time_offset = 0
+            self.logger.warning("Time sync failed: %s", e)
+            self._offset_ms = 0
+        # python-binance stamps every signed request itself (overwriting any timestamp
+        # passed in), so the offset only takes effect through its timestamp_offset
+        self.client.timestamp_offset = self._offset_ms
+
+    def _rebuild_symbol_index(self):
+        """
+        Fetch futures exchange info and rebuild the symbol index
+        :return: Exchange info response
+        """
+        return self._store_exchange_info(self.client.futures_exchange_info())
+
+    def _refresh_symbol_index_loop(self):
+        """Background thread: rebuild the symbol index every EXCHANGE_INFO_TTL seconds"""
+        while not self._index_refresh_stop.wait(self.EXCHANGE_INFO_TTL):
+            try:
+                self._rebuild_symbol_index()
+            except Exception as e:
+                self.logger.warning("Symbol index refresh failed: %s", e)
+
+    def _get_exchange_info(self):
+        """
+        Get futures exchange info, re-fetching only when the cache has expired
+        :return: Exchange info response
+        """
+        if self._exchange_info_fresh():
+            return self._exchange_info_cache
+        return self._rebuild_symbol_index()
 
     def validate_symbol(self, symbol):
         """
@@ -64,13 +552,10 @@ class BasicBot:
         :return: Boolean indicating validity
         """
         try:
-            info = self.client.futures_exchange_info()
-            for s in info['symbols']:
-                if s['symbol'] == symbol and s['status'] == 'TRADING':
-                    return True
-            return False
+            self._get_exchange_info()
+            return self._symbol_tradable(symbol)
         except BinanceAPIException as e:
-            self.logger.error(f"Error validating symbol: {e}")
+            self.logger.error("Error validating symbol: %s", e)
             return False
 
     def validate_quantity(self, symbol, quantity):
@@ -81,58 +566,92 @@ class BasicBot:
         :return: Boolean indicating validity
         """
         try:
-            info = self.client.futures_exchange_info()
-            for s in info['symbols']:
-                if s['symbol'] == symbol:
-                    filters = {f['filterType']: f for f in s['filters']}
-                    lot_size = filters['LOT_SIZE']
-                    min_qty = float(lot_size['minQty'])
-                    max_qty = float(lot_size['maxQty'])
-                    step_size = float(lot_size['stepSize'])
-                    
-                    if quantity < min_qty or quantity > max_qty:
-                        return False
-                    
-                    # Check if quantity is a multiple of step size
-                    if (quantity / step_size) % 1 != 0:
-                        return False
-                    
-                    return True
+            self._get_exchange_info()
+            return self._quantity_valid(symbol, quantity)
+        except BinanceAPIException as e:
+            self.logger.error("Error validating quantity: %s", e)
             return False
+
+    def validate_price(self, symbol, price):
+        """
+        Validate that a limit/stop price meets the exchange tick size requirements
+        :param symbol: Trading pair symbol
+        :param price: Price to check
+        :return: Boolean indicating validity
+        """
+        return self.validate_prices(symbol, [price])
+
+    def validate_prices(self, symbol, prices):
+        """
+        Validate several prices, sharing one exchange info lookup
+        :param symbol: Trading pair symbol
+        :param prices: Iterable of prices to check
+        :return: Boolean indicating whether all prices are valid
+        """
+        try:
+            self._get_exchange_info()
+            return self._prices_valid(symbol, prices)
         except BinanceAPIException as e:
-            self.logger.error(f"Error validating quantity: {e}")
+            self.logger.error("Error validating price: %s", e)
             return False
 
-    def place_market_order(self, symbol, side, quantity, retries=3):
+    def _place(self, *, retries=3, **params):
+        """
+        Send a new order with the retry logic shared by all place_* methods
+        :param retries: Number of retry attempts
+        :param params: Order parameters (symbol, side, type, quantity, ...)
+        :return: Order response or None if failed
+        """
+        steps = self._place_steps(params, retries)
+        resume, value = steps.send, None
+        while True:
+            try:
+                name, *args = resume(value)
+            except StopIteration as done:
+                return done.value
+            try:
+                resume, value = steps.send, getattr(self, name)(*args)
+            except Exception as e:  # Handed to _place_steps, which decides what happens next
+                resume, value = steps.throw, e
+
+    def _request_not_sent(self, error):
+        """Tell whether a network error happened before the request was sent"""
+        return request_not_sent(error)
+
+    def _send_order(self, params):
+        """Send one new order request"""
+        return self.client.futures_create_order(**params)
+
+    def _find_order(self, symbol, client_order_id):
+        """
+        Look up an order by the client order id it was sent with
+        :param symbol: Trading pair symbol
+        :param client_order_id: newClientOrderId of the order
+        :return: Order, or None if Binance has no order with that id
+        """
+        try:
+            return self.client.futures_get_order(symbol=symbol, origClientOrderId=client_order_id)
+        except BinanceAPIException as e:
+            if e.code == ORDER_NOT_FOUND:
+                return None
+            raise
+
+    def place_market_order(self, symbol, side, quantity, retries=3, reduce_only=False):
         """
         Place a market order with retry logic
         :param symbol: Trading pair symbol
         :param side: 'BUY' or 'SELL'
         :param quantity: Quantity to trade
         :param retries: Number of retry attempts
+        :param reduce_only: Only reduce an existing position, never open or flip one
         :return: Order response or None if failed
         """
-        for attempt in range(retries):
-            try:
-                self.sync_time()  # Sync time before each attempt
-                self.logger.info(f"Placing market order (attempt {attempt + 1}): {side} {quantity} {symbol}")
-                order = self.client.futures_create_order(
-                    symbol=symbol,
-                    side=side,
-                    type='MARKET',
-                    quantity=quantity,
-                    timestamp=int(time.time() * 1000 + self.time_offset)
-                )
-                self.logger.info(f"Market order executed: {order}")
-                return order
-            except BinanceAPIException as e:
-                if e.code == -1021 and attempt < retries - 1:  # Timestamp error
-                    time.sleep(1)
-                    continue
-                self.logger.error(f"Market order failed: {e}")
-                return None
+        return self._place(
+            symbol=symbol, side=side, type='MARKET', quantity=quantity,
+            reduceOnly='true' if reduce_only else None, retries=retries
+        )
 
-    def place_limit_order(self, symbol, side, quantity, price, retries=3):
+    def place_limit_order(self, symbol, side, quantity, price, retries=3, reduce_only=False):
         """
         Place a limit order with retry logic
         :param symbol: Trading pair symbol
@@ -140,28 +659,13 @@ class BasicBot:
         :param quantity: Quantity to trade
         :param price: Limit price
         :param retries: Number of retry attempts
+        :param reduce_only: Only reduce an existing position, never open or flip one
         :return: Order response or None if failed
         """
-        for attempt in range(retries):
-            try:
-                self.sync_time()  # Sync time before each attempt
-                self.logger.info(f"Placing limit order (attempt {attempt + 1}): {side} {quantity} {symbol} @ {price}")
-                order = self.client.futures_create_order(
-                    symbol=symbol,
-                    side=side,
-                    type='LIMIT',
-                    timeInForce='GTC',
-                    quantity=quantity,
-                    price=price
-                )
-                self.logger.info(f"Limit order placed: {order}")
-                return order
-            except BinanceAPIException as e:
-                if e.code == -1021 and attempt < retries - 1:  # Timestamp error
-                    time.sleep(1)
-                    continue
-                self.logger.error(f"Limit order failed: {e}")
-                return None
+        return self._place(
+            symbol=symbol, side=side, type='LIMIT', timeInForce='GTC',
+            quantity=quantity, price=price, reduceOnly='true' if reduce_only else None, retries=retries
+        )
 
     def place_stop_limit_order(self, symbol, side, quantity, price, stop_price, retries=3):
         """
@@ -174,27 +678,19 @@ class BasicBot:
         :param retries: Number of retry attempts
         :return: Order response or None if failed
         """
-        for attempt in range(retries):
-            try:
-                self.sync_time()  # Sync time before each attempt
-                self.logger.info(f"Placing stop-limit order (attempt {attempt + 1}): {side} {quantity} {symbol} @ {price} (stop: {stop_price})")
-                order = self.client.futures_create_order(
-                    symbol=symbol,
-                    side=side,
-                    type='STOP',
-                    timeInForce='GTC',
-                    quantity=quantity,
-                    price=price,
-                    stopPrice=stop_price
-                )
-                self.logger.info(f"Stop-limit order placed: {order}")
-                return order
-            except BinanceAPIException as e:
-                if e.code == -1021 and attempt < retries - 1:  # Timestamp error
-                    time.sleep(1)
-                    continue
-                self.logger.error(f"Stop-limit order failed: {e}")
-                return None
+        return self._place(
+            symbol=symbol, side=side, type='STOP', timeInForce='GTC',
+            quantity=quantity, price=price, stopPrice=stop_price, retries=retries
+        )
+
+    def place_order_spec(self, spec):
+        """
+        Place a single order described by an order spec
+        :param spec: Dict with 'type' plus the keyword arguments of the matching ORDER_METHODS method
+        :return: Order response or None if failed
+        """
+        method, params = self._order_spec_call(spec)
+        return method(**params)
 
     def get_order_status(self, symbol, order_id):
         """
@@ -205,10 +701,10 @@ class BasicBot:
         """
         try:
             status = self.client.futures_get_order(symbol=symbol, orderId=order_id)
-            self.logger.info(f"Order status: {status}")
+            self.logger.info("Order status: %s", status)
             return status
         except BinanceAPIException as e:
-            self.logger.error(f"Failed to get order status: {e}")
+            self.logger.error("Failed to get order status: %s", e)
             return None
 
     def cancel_order(self, symbol, order_id):
@@ -220,10 +716,10 @@ class BasicBot:
         """
         try:
             result = self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
-            self.logger.info(f"Order cancelled: {result}")
+            self.logger.info("Order cancelled: %s", result)
             return result
         except BinanceAPIException as e:
-            self.logger.error(f"Failed to cancel order: {e}")
+            self.logger.error("Failed to cancel order: %s", e)
             return None
         
     def close_position(self, symbol, side=None, quantity=None, order_type='MARKET', price=None, retries=3):
@@ -247,21 +743,28 @@ class BasicBot:
                 if quantity is None:
                     quantity = abs(float(position['positionAmt']))
             
+            # reduceOnly: a stale or mistaken size can never open an opposite position
             if order_type == 'MARKET':
-                return self.place_market_order(symbol, side, quantity, retries)
+                return self.place_market_order(symbol, side, quantity, retries, reduce_only=True)
             elif order_type == 'LIMIT':
                 if price is None:
                     raise ValueError("Price required for limit orders")
-                return self.place_limit_order(symbol, side, quantity, price, retries)
+                return self.place_limit_order(symbol, side, quantity, price, retries, reduce_only=True)
             else:
                 raise ValueError("Invalid order type")
         
         except Exception as e:
-            self.logger.error(f"Failed to close position: {e}")
+            self.logger.error("Failed to close position: %s", e)
             return None
 
     def get_position(self, symbol):
         """Get current position details"""
+        if self._stream_live.is_set():
+            position = self._positions.get(symbol)
+            if position and float(position['positionAmt']) != 0:
+                return position
+            return None
+
         try:
             positions = self.client.futures_position_information()
             for p in positions:
@@ -269,20 +772,446 @@ class BasicBot:
                     return p
             return None
         except Exception as e:
-            self.logger.error(f"Error getting position: {e}")
+            self.logger.error("Error getting position: %s", e)
             return None 
 
-    def print_position_details(self, position):
+    @staticmethod
+    def print_position_details(position):
         """Print formatted position information"""
         print(f"\n📊 Current Position:")
         print(f"Symbol: {position['symbol']}")
         print(f"Direction: {'LONG' if float(position['positionAmt']) > 0 else 'SHORT'}")
         print(f"Size: {abs(float(position['positionAmt']))}")
         print(f"Entry Price: {position['entryPrice']}")
-        print(f"Mark Price: {position['markPrice']}")
+        print(f"Mark Price: {position.get('markPrice', 'N/A')}")
         print(f"Unrealized PnL: {position['unRealizedProfit']}")       
 
 
+class AsyncBasicBot(BaseBot):
+    """
+    aiohttp-based variant of BasicBot.
+    All REST calls share one keep-alive connection pool, so several
+    order/cancel/status requests can be in flight at the same time.
+    """
+    FUTURES_URL = 'https://fapi.binance.com'
+    FUTURES_TESTNET_URL = 'https://testnet.binancefuture.com'
+
+    # Binance caps order placement at 10 orders per second
+    ORDER_RATE_LIMIT = 10
+
+    # Order parameters that repeat across orders; urlencoded once per combination
+    STATIC_ORDER_PARAMS = ('symbol', 'side', 'type', 'timeInForce')
+
+    # Errors raised before the request was sent (ConnectionTimeoutError needs aiohttp >= 3.10)
+    NOT_SENT_ERRORS = (
+        aiohttp.ClientConnectorError,
+        getattr(aiohttp, 'ConnectionTimeoutError', aiohttp.ClientConnectorError)
+    )
+    # Network errors _place_steps handles; anything else propagates out of _place
+    NETWORK_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+    _sleep = staticmethod(asyncio.sleep)
+
+    def __init__(self, api_key, api_secret, testnet=True):
+        """
+        Initialize the async trading bot with API credentials.
+        Must be called from inside a running event loop - use AsyncBasicBot.create()
+        :param api_key: Binance API key
+        :param api_secret: Binance API secret
+        :param testnet: Boolean indicating whether to use testnet (default True)
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.testnet = testnet
+        self._offset_ms = 0
+        self.base_url = self.FUTURES_TESTNET_URL if testnet else self.FUTURES_URL
+        self._sign = hmac_signer(api_secret)
+
+        # Configure logging
+        configure_logging()
+        self.logger = logging.getLogger('BinanceTradingBot')
+
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            ),
+            timeout=aiohttp.ClientTimeout(total=10, connect=2),
+            headers={'X-MBX-APIKEY': api_key}
+        )
+        # Token bucket: each order takes a token that is handed back one second later
+        self._order_tokens = asyncio.Semaphore(self.ORDER_RATE_LIMIT)
+        self._index_refresh_task = None
+        self._prefix_cache = {}
+
+    @classmethod
+    async def create(cls, api_key, api_secret, testnet=True):
+        """
+        Create the bot and perform the initial time synchronization
+        :return: Connected AsyncBasicBot instance
+        """
+        self = cls(api_key, api_secret, testnet)
+        try:
+            await self.sync_time()  # Initial time synchronization
+            self.logger.info("Successfully connected to Binance API (async)")
+        except Exception as e:
+            self.logger.error("Failed to initialize client: %s", e)
+            await self.close()
+            raise
+
+        # Index symbols once up front so validation never waits on the network
+        try:
+            await self._rebuild_symbol_index()
+        except Exception as e:
+            self.logger.warning("Initial symbol index failed, will retry on demand: %s", e)
+        self._index_refresh_task = asyncio.create_task(self._refresh_symbol_index_loop())
+        return self
+
+    async def close(self):
+        """Stop background symbol index refreshes and close the underlying HTTP session"""
+        if self._index_refresh_task:
+            self._index_refresh_task.cancel()
+        await self.session.close()
+
+    async def _request(self, method, path, params=None, signed=False, prefix=''):
+        """
+        Send a REST request to the futures API
+        :param method: HTTP method ('GET', 'POST', 'DELETE', ...)
+        :param path: Endpoint path (e.g., /fapi/v1/order)
+        :param params: Query parameters
+        :param signed: Whether to add timestamp and HMAC signature
+        :param prefix: Already urlencoded query string placed before params
+        :return: Decoded JSON response
+        """
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        if signed:
+            params['timestamp'] = self._now_ms()
+        qs = urlencode(params)
+        if prefix:
+            qs = f"{prefix}&{qs}" if qs else prefix
+        if signed:
+            signature = self._sign(qs)
+            qs = f"{qs}&signature={signature}"
+
+        url = f"{self.base_url}{path}"
+        if qs:
+            url = f"{url}?{qs}"
+        async with self.session.request(method, url) as response:
+            body = await response.read()
+            if not 200 <= response.status < 300:
+                raise AsyncBinanceAPIException(response, response.status, body.decode('utf-8', errors='replace'))
+            return json_loads(body)
+
+    async def _signed_request(self, method, path, **params):
+        """Send a signed REST request to the futures API"""
+        return await self._request(method, path, params, signed=True)
+
+    def _static_prefix(self, params):
+        """
+        Get the urlencoded order parameters that repeat across orders (symbol, side, type, ...)
+        :param params: Order parameters
+        :return: Query string prefix, encoded once per combination
+        """
+        key = tuple(params.get(name) for name in self.STATIC_ORDER_PARAMS)
+        prefix = self._prefix_cache.get(key)
+        if prefix is None:
+            prefix = urlencode({
+                name: value for name, value in zip(self.STATIC_ORDER_PARAMS, key) if value is not None
+            })
+            self._prefix_cache[key] = prefix
+        return prefix
+
+    async def _order_request(self, **params):
+        """
+        Send a new order, waiting for a rate limit token first.
+        Only the per-order fields (quantity, price, id, timestamp) are urlencoded per call.
+        :return: Order response
+        """
+        prefix = self._static_prefix(params)
+        dynamic = {k: v for k, v in params.items() if k not in self.STATIC_ORDER_PARAMS}
+        await self._order_tokens.acquire()
+        asyncio.get_running_loop().call_later(1, self._order_tokens.release)
+        return await self._request('POST', '/fapi/v1/order', dynamic, signed=True, prefix=prefix)
+
+    async def sync_time(self):
+        """Synchronize local time with Binance server"""
+        try:
+            server_time = (await self._request('GET', '/fapi/v1/time'))['serverTime']
+            self._offset_ms = server_time - time.time_ns() // 1_000_000
+            self.logger.info("Time synchronized. Offset: %sms", self._offset_ms)
+        except Exception as e:
+            self.logger.warning("Time sync failed: %s", e)
+            self._offset_ms = 0
+
+    def _now_ms(self):
+        """
+        Current server time estimated from the local clock and the last sync offset
+        :return: Server timestamp in milliseconds
+        """
+        return time.time_ns() // 1_000_000 + self._offset_ms
+
+    async def _rebuild_symbol_index(self):
+        """
+        Fetch futures exchange info and rebuild the symbol index
+        :return: Exchange info response
+        """
+        return self._store_exchange_info(await self._request('GET', '/fapi/v1/exchangeInfo'))
+
+    async def _refresh_symbol_index_loop(self):
+        """Background task: rebuild the symbol index every EXCHANGE_INFO_TTL seconds"""
+        while True:
+            await asyncio.sleep(self.EXCHANGE_INFO_TTL)
+            try:
+                await self._rebuild_symbol_index()
+            except Exception as e:
+                self.logger.warning("Symbol index refresh failed: %s", e)
+
+    async def _get_exchange_info(self):
+        """
+        Get futures exchange info, re-fetching only when the cache has expired
+        :return: Exchange info response
+        """
+        if self._exchange_info_fresh():
+            return self._exchange_info_cache
+        return await self._rebuild_symbol_index()
+
+    async def validate_symbol(self, symbol):
+        """
+        Validate that the symbol exists and is tradable
+        :param symbol: Trading pair symbol (e.g., BTCUSDT)
+        :return: Boolean indicating validity
+        """
+        try:
+            await self._get_exchange_info()
+            return self._symbol_tradable(symbol)
+        except BinanceAPIException as e:
+            self.logger.error("Error validating symbol: %s", e)
+            return False
+
+    async def validate_quantity(self, symbol, quantity):
+        """
+        Validate that the quantity meets the exchange requirements
+        :param symbol: Trading pair symbol
+        :param quantity: Quantity to trade
+        :return: Boolean indicating validity
+        """
+        try:
+            await self._get_exchange_info()
+            return self._quantity_valid(symbol, quantity)
+        except BinanceAPIException as e:
+            self.logger.error("Error validating quantity: %s", e)
+            return False
+
+    async def validate_price(self, symbol, price):
+        """
+        Validate that a limit/stop price meets the exchange tick size requirements
+        :param symbol: Trading pair symbol
+        :param price: Price to check
+        :return: Boolean indicating validity
+        """
+        return await self.validate_prices(symbol, [price])
+
+    async def validate_prices(self, symbol, prices):
+        """
+        Validate several prices, sharing one exchange info lookup
+        :param symbol: Trading pair symbol
+        :param prices: Iterable of prices to check
+        :return: Boolean indicating whether all prices are valid
+        """
+        try:
+            await self._get_exchange_info()
+            return self._prices_valid(symbol, prices)
+        except BinanceAPIException as e:
+            self.logger.error("Error validating price: %s", e)
+            return False
+
+    async def _place(self, *, retries=3, **params):
+        """
+        Send a new order with the retry logic shared by all place_* methods
+        :param retries: Number of retry attempts
+        :param params: Order parameters (symbol, side, type, quantity, ...)
+        :return: Order response or None if failed
+        """
+        steps = self._place_steps(params, retries)
+        resume, value = steps.send, None
+        while True:
+            try:
+                name, *args = resume(value)
+            except StopIteration as done:
+                return done.value
+            try:
+                resume, value = steps.send, await getattr(self, name)(*args)
+            except Exception as e:  # Handed to _place_steps, which decides what happens next
+                resume, value = steps.throw, e
+
+    def _request_not_sent(self, error):
+        """Tell whether a network error happened before the request was sent"""
+        return isinstance(error, self.NOT_SENT_ERRORS)
+
+    async def _send_order(self, params):
+        """Send one new order request"""
+        return await self._order_request(**params)
+
+    async def _find_order(self, symbol, client_order_id):
+        """
+        Look up an order by the client order id it was sent with
+        :param symbol: Trading pair symbol
+        :param client_order_id: newClientOrderId of the order
+        :return: Order, or None if Binance has no order with that id
+        """
+        try:
+            return await self._signed_request('GET', '/fapi/v1/order', symbol=symbol, origClientOrderId=client_order_id)
+        except BinanceAPIException as e:
+            if e.code == ORDER_NOT_FOUND:
+                return None
+            raise
+
+    async def place_market_order(self, symbol, side, quantity, retries=3, reduce_only=False):
+        """
+        Place a market order with retry logic
+        :param symbol: Trading pair symbol
+        :param side: 'BUY' or 'SELL'
+        :param quantity: Quantity to trade
+        :param retries: Number of retry attempts
+        :param reduce_only: Only reduce an existing position, never open or flip one
+        :return: Order response or None if failed
+        """
+        return await self._place(
+            symbol=symbol, side=side, type='MARKET', quantity=quantity,
+            reduceOnly='true' if reduce_only else None, retries=retries
+        )
+
+    async def place_limit_order(self, symbol, side, quantity, price, retries=3, reduce_only=False):
+        """
+        Place a limit order with retry logic
+        :param symbol: Trading pair symbol
+        :param side: 'BUY' or 'SELL'
+        :param quantity: Quantity to trade
+        :param price: Limit price
+        :param retries: Number of retry attempts
+        :param reduce_only: Only reduce an existing position, never open or flip one
+        :return: Order response or None if failed
+        """
+        return await self._place(
+            symbol=symbol, side=side, type='LIMIT', timeInForce='GTC',
+            quantity=quantity, price=price, reduceOnly='true' if reduce_only else None, retries=retries
+        )
+
+    async def place_stop_limit_order(self, symbol, side, quantity, price, stop_price, retries=3):
+        """
+        Place a stop-limit order with retry logic
+        :param symbol: Trading pair symbol
+        :param side: 'BUY' or 'SELL'
+        :param quantity: Quantity to trade
+        :param price: Limit price
+        :param stop_price: Stop price
+        :param retries: Number of retry attempts
+        :return: Order response or None if failed
+        """
+        return await self._place(
+            symbol=symbol, side=side, type='STOP', timeInForce='GTC',
+            quantity=quantity, price=price, stopPrice=stop_price, retries=retries
+        )
+
+    async def place_order_spec(self, spec):
+        """
+        Place a single order described by an order spec
+        :param spec: Dict with 'type' plus the keyword arguments of the matching ORDER_METHODS method
+        :return: Order response or None if failed
+        """
+        method, params = self._order_spec_call(spec)
+        return await method(**params)
+
+    async def place_orders_batch(self, specs):
+        """
+        Place several orders concurrently on the shared keep-alive session
+        :param specs: List of dicts, each with 'type' ('MARKET', 'LIMIT', 'STOP' or 'CLOSE') and
+                      the keyword arguments of the matching ORDER_METHODS method, e.g.
+                      {'type': 'LIMIT', 'symbol': 'BTCUSDT', 'side': 'BUY', 'quantity': 0.001, 'price': 100000}
+        :return: List of order responses (None or an exception for failed orders), in spec order
+        """
+        self.logger.info("Placing batch of %s orders", len(specs))
+        return await asyncio.gather(*(self.place_order_spec(spec) for spec in specs), return_exceptions=True)
+
+    async def get_order_status(self, symbol, order_id):
+        """
+        Check the status of an order
+        :param symbol: Trading pair symbol
+        :param order_id: Order ID to check
+        :return: Order status or None if failed
+        """
+        try:
+            status = await self._signed_request('GET', '/fapi/v1/order', symbol=symbol, orderId=order_id)
+            self.logger.info("Order status: %s", status)
+            return status
+        except BinanceAPIException as e:
+            self.logger.error("Failed to get order status: %s", e)
+            return None
+
+    async def cancel_order(self, symbol, order_id):
+        """
+        Cancel an existing order
+        :param symbol: Trading pair symbol
+        :param order_id: Order ID to cancel
+        :return: Cancellation response or None if failed
+        """
+        try:
+            result = await self._signed_request('DELETE', '/fapi/v1/order', symbol=symbol, orderId=order_id)
+            self.logger.info("Order cancelled: %s", result)
+            return result
+        except BinanceAPIException as e:
+            self.logger.error("Failed to cancel order: %s", e)
+            return None
+
+    async def close_position(self, symbol, side=None, quantity=None, order_type='MARKET', price=None, retries=3):
+        """
+        Close a position (market or limit)
+        :param symbol: Trading pair (e.g. BTCUSDT)
+        :param side: Optional (auto-detects if None)
+        :param quantity: Optional (uses full position if None)
+        :param order_type: 'MARKET' or 'LIMIT'
+        :param price: Required for limit orders
+        """
+        try:
+            # Auto-detect position if side/quantity not provided
+            if side is None or quantity is None:
+                position = await self.get_position(symbol)
+                if not position:
+                    raise ValueError("No open position found")
+
+                if side is None:
+                    side = 'SELL' if float(position['positionAmt']) > 0 else 'BUY'
+                if quantity is None:
+                    quantity = abs(float(position['positionAmt']))
+
+            # reduceOnly: a stale or mistaken size can never open an opposite position
+            if order_type == 'MARKET':
+                return await self.place_market_order(symbol, side, quantity, retries, reduce_only=True)
+            elif order_type == 'LIMIT':
+                if price is None:
+                    raise ValueError("Price required for limit orders")
+                return await self.place_limit_order(symbol, side, quantity, price, retries, reduce_only=True)
+            else:
+                raise ValueError("Invalid order type")
+
+        except Exception as e:
+            self.logger.error("Failed to close position: %s", e)
+            return None
+
+    async def get_position(self, symbol):
+        """Get current position details"""
+        try:
+            positions = await self._signed_request('GET', '/fapi/v2/positionRisk')
+            for p in positions:
+                if p['symbol'] == symbol and float(p['positionAmt']) != 0:
+                    return p
+            return None
+        except Exception as e:
+            self.logger.error("Error getting position: %s", e)
+            return None
+
+
 def parse_args():
     """
     Parse command line arguments
@@ -304,6 +1233,15 @@ def parse_args():
     parser.add_argument('--close-type', choices=['MARKET', 'LIMIT'], default='MARKET', help='Order type for closing position')
     parser.add_argument('--close-price', type=float, help='Price for limit close order')
 
+    # Client selection
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Use the aiohttp-based async client (close + new order are sent concurrently)')
+
+    # Daemon mode
+    parser.add_argument('--daemon', action='store_true',
+                        help='Keep running and read JSON order specs from stdin, one per line')
+    parser.add_argument('--workers', type=int, default=4, help='Worker threads for --daemon (default 4)')
+
 
     # Mutually exclusive order types
     order_type_group = parser.add_mutually_exclusive_group(required=False)
@@ -314,17 +1252,220 @@ def parse_args():
 
     args = parser.parse_args()
 
-    # Enforce one of the order type flags unless --close is specified
-    if not args.close and not (args.market or args.limit or args.stop_limit):
-        parser.error("One of --market, --limit, or --stop-limit is required unless --close is specified.")
+    # Enforce one of the order type flags unless --close or --daemon is specified
+    if not (args.close or args.daemon) and not (args.market or args.limit or args.stop_limit):
+        parser.error("One of --market, --limit, or --stop-limit is required unless --close or --daemon is specified.")
+
+    # Daemon mode runs worker threads on the sync client only
+    if args.use_async and args.daemon:
+        parser.error("--async cannot be combined with --daemon.")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1.")
 
     return args
 
+def order_prices(args):
+    """
+    Collect the limit/stop prices an order will be sent with
+    :param args: Parsed arguments
+    :return: List of prices (empty for market orders)
+    """
+    if args.limit:
+        return [args.limit]
+    return list(args.stop_limit or [])
+
+def print_order_details(order):
+    """Print the result of a newly placed order"""
+    if order:
+        print(f"\nOrder successfully placed:")
+        print(f"ID: {order['orderId']}")
+        print(f"Symbol: {order['symbol']}")
+        print(f"Side: {order['side']}")
+        print(f"Type: {order['type']}")
+        print(f"Quantity: {order['origQty']}")
+        if 'price' in order:
+            print(f"Price: {order['price']}")
+        if 'stopPrice' in order:
+            print(f"Stop Price: {order['stopPrice']}")
+        print(f"Status: {order['status']}")
+    else:
+        print("\nFailed to place order. Check logs for details.")
+
+def print_close_details(order):
+    """Print the result of a position close order"""
+    if order:
+        print(f"\nPosition closed successfully:")
+        print(f"ID: {order['orderId']}")
+        print(f"Executed Qty: {order.get('executedQty', '0')}")
+        print(f"Status: {order['status']}")
+    else:
+        print("\nFailed to close position")
+
+async def async_main(args):
+    """
+    Run the trading bot with the async client.
+    Closing a position and placing a new order are fired concurrently.
+    """
+    bot = await AsyncBasicBot.create(args.api_key, args.api_secret)
+    try:
+        coros = []
+        handlers = []
+
+        # Position Closing Flow
+        if args.close:
+            print("\n=== Closing Position ===")
+            position = await bot.get_position(args.symbol)
+            if position:
+                BasicBot.print_position_details(position)
+                coros.append(bot.close_position(
+                    symbol=args.symbol,
+                    order_type=args.close_type,
+                    price=args.close_price
+                ))
+                handlers.append(print_close_details)
+            else:
+                print(f"No open position found for {args.symbol}")
+
+        # Order Placement Flow
+        if args.market or args.limit or args.stop_limit:
+            print("\n=== Placing New Order ===")
+            # Validated one after the other so the second check hits the exchange info cache
+            if not await bot.validate_symbol(args.symbol):
+                print(f"Invalid or untradable symbol: {args.symbol}")
+            elif not await bot.validate_quantity(args.symbol, args.quantity):
+                print(f"Invalid quantity for symbol {args.symbol}")
+            elif not await bot.validate_prices(args.symbol, order_prices(args)):
+                print(f"Invalid price for symbol {args.symbol}")
+            else:
+                if args.market:
+                    coros.append(bot.place_market_order(args.symbol, args.side, args.quantity))
+                elif args.limit:
+                    coros.append(bot.place_limit_order(args.symbol, args.side, args.quantity, args.limit))
+                else:
+                    price, stop_price = args.stop_limit
+                    coros.append(bot.place_stop_limit_order(args.symbol, args.side, args.quantity, price, stop_price))
+                handlers.append(print_order_details)
+
+        # Fire all orders concurrently on the keep-alive pool
+        results = await asyncio.gather(*coros)
+        for handler, order in zip(handlers, results):
+            handler(order)
+    finally:
+        await bot.close()
+
+def validate_order_spec(bot, spec):
+    """
+    Check an order spec against the bot's cached exchange filters
+    :param bot: BasicBot instance
+    :param spec: Order spec dict
+    :return: Error message, or None if the spec is valid
+    """
+    order_type = spec.get('type')
+    if order_type not in bot.ORDER_METHODS:
+        return f"Invalid order type: {order_type}"
+    if order_type == 'CLOSE':
+        return None
+    symbol = spec.get('symbol')
+    if not bot.validate_symbol(symbol):
+        return f"Invalid or untradable symbol: {symbol}"
+    if spec.get('quantity') is None:
+        return "Quantity required"
+    if not bot.validate_quantity(symbol, spec.get('quantity')):
+        return f"Invalid quantity for symbol {symbol}"
+    prices = [spec[key] for key in ('price', 'stop_price') if spec.get(key) is not None]
+    if not bot.validate_prices(symbol, prices):
+        return f"Invalid price for symbol {symbol}"
+    return None
+
+def run_daemon(bot, args):
+    """
+    Serve order specs from stdin until EOF.
+    Each line is a JSON object such as {"type": "LIMIT", "side": "BUY", "quantity": 0.001, "price": 100000};
+    'symbol' defaults to --symbol. Specs are queued to a pool of worker threads sharing the
+    bot and its HTTP connection pool, and each result is printed as one JSON line.
+    Results arrive in completion order, so each one carries the input 'line' number and,
+    if the spec had one, its optional 'id' field.
+    """
+    orders = queue.Queue()
+    output_lock = threading.Lock()
+
+    def respond(line_no, request_id, response):
+        response = {'line': line_no, **response}
+        if request_id is not None:
+            response = {'id': request_id, **response}
+        with output_lock:
+            print(json.dumps(response), flush=True)
+
+    def worker():
+        while True:
+            item = orders.get()
+            if item is None:
+                return
+            line_no, request_id, spec = item
+            try:
+                error = validate_order_spec(bot, spec)
+                if error:
+                    respond(line_no, request_id, {'spec': spec, 'error': error})
+                    continue
+                order = bot.place_order_spec(spec)
+                if order:
+                    respond(line_no, request_id, {'spec': spec, 'order': order})
+                else:
+                    respond(line_no, request_id, {'spec': spec, 'error': 'Order failed. Check logs for details.'})
+            except Exception as e:
+                respond(line_no, request_id, {'spec': spec, 'error': str(e)})
+
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(args.workers)]
+    for thread in workers:
+        thread.start()
+
+    print(f"Daemon ready with {args.workers} workers, reading order specs from stdin", file=sys.stderr)
+    for line_no, line in enumerate(sys.stdin, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            spec = json_loads(line)
+        except ValueError as e:
+            respond(line_no, None, {'error': f"Invalid JSON: {e}"})
+            continue
+        if not isinstance(spec, dict):
+            respond(line_no, None, {'error': 'Order spec must be a JSON object'})
+            continue
+        # 'id' is only echoed back, never sent to Binance
+        request_id = spec.pop('id', None)
+        spec.setdefault('symbol', args.symbol)
+        orders.put((line_no, request_id, spec))
+
+    for _ in workers:
+        orders.put(None)
+    for thread in workers:
+        thread.join()
+
 def main():
     """
     Main function to run the trading bot
     """
     args = parse_args()
+
+    if args.use_async:
+        try:
+            asyncio.run(async_main(args))
+        except Exception as e:
+            print(f"\nAn error occurred: {e}")
+        return
+
+    if args.daemon:
+        try:
+            bot = BasicBot(args.api_key, args.api_secret, user_stream=True)
+        except Exception as e:
+            print(f"\nAn error occurred: {e}")
+            return
+        try:
+            run_daemon(bot, args)
+        finally:
+            bot.close()
+        return
     
     try:
         # Initialize the bot
@@ -332,7 +1473,7 @@ def main():
         
         # Verify time synchronization
         server_time = bot.client.get_server_time()['serverTime']
-        local_time = int(time.time() * 1000)
+        local_time = time.time_ns() // 1_000_000
         print(f"Time synchronization check:")
         print(f"Server time: {server_time}")
         print(f"Local time: {local_time}")
@@ -355,13 +1496,7 @@ def main():
                 price=args.close_price
             )
             
-            if order:
-                print(f"\nPosition closed successfully:")
-                print(f"ID: {order['orderId']}")
-                print(f"Executed Qty: {order.get('executedQty', '0')}")
-                print(f"Status: {order['status']}")
-            else:
-                print("\nFailed to close position")
+            print_close_details(order)
             return
         
         # Order Placement Flow
@@ -375,6 +1510,11 @@ def main():
         if not bot.validate_quantity(args.symbol, args.quantity):
             print(f"Invalid quantity for symbol {args.symbol}")
             return
+
+        # Validate limit/stop prices
+        if not bot.validate_prices(args.symbol, order_prices(args)):
+            print(f"Invalid price for symbol {args.symbol}")
+            return
         
         # Place the appropriate order
         if args.market:
@@ -385,20 +1525,7 @@ def main():
             price, stop_price = args.stop_limit
             order = bot.place_stop_limit_order(args.symbol, args.side, args.quantity, price, stop_price)
         
-        if order:
-            print(f"\nOrder successfully placed:")
-            print(f"ID: {order['orderId']}")
-            print(f"Symbol: {order['symbol']}")
-            print(f"Side: {order['side']}")
-            print(f"Type: {order['type']}")
-            print(f"Quantity: {order['origQty']}")
-            if 'price' in order:
-                print(f"Price: {order['price']}")
-            if 'stopPrice' in order:
-                print(f"Stop Price: {order['stopPrice']}")
-            print(f"Status: {order['status']}")
-        else:
-            print("\nFailed to place order. Check logs for details.")
+        print_order_details(order)
             
     except Exception as e:
         print(f"\nAn error occurred: {e}")